@@ -91,7 +91,115 @@ async function getPassword() {
     return "123";
   }
 }
+const BLOB_MAGIC = [0x42, 0x4c, 0x4f, 0x42]; // "BLOB"
+const BLOB_HEADER_BODY_SIZE = 59;
+const BLOB_HEADER_SIZE = 75;
+
+function isBlobV2(data) {
+  return data.length >= BLOB_HEADER_SIZE && BLOB_MAGIC.every((b, i) => data[i] === b);
+}
+
+async function hmacSha256(keyBytes, data) {
+  const key = await crypto.subtle.importKey(
+    "raw", keyBytes, { name: "HMAC", hash: "SHA-256" }, false, ["sign"]
+  );
+  return new Uint8Array(await crypto.subtle.sign("HMAC", key, data));
+}
+
+function bytesEqual(a, b) {
+  if (a.length !== b.length) return false;
+  let diff = 0;
+  for (let i = 0; i < a.length; i++) diff |= a[i] ^ b[i];
+  return diff === 0;
+}
+
+// Formato v2: header in chiaro con key-check, dati in sezioni AES-GCM autenticate
+async function decryptDataV2(encryptedData, password) {
+  const header = encryptedData.slice(0, BLOB_HEADER_SIZE);
+  const view = new DataView(header.buffer, header.byteOffset, header.byteLength);
+  const version = view.getUint8(4);
+  if (version !== 2) {
+    console.error(` Versione blob non supportata: ${version}`);
+    return null;
+  }
+  const salt = header.slice(7, 23);
+  const noncePrefix = header.slice(23, 31);
+  const chunkSize = view.getUint32(31);
+  let remaining = Number(view.getBigUint64(35));
+  const keyCheck = header.slice(43, 59);
+  const headerMac = header.slice(59, 75);
+
+  const keyMaterial = await crypto.subtle.importKey(
+    "raw",
+    new TextEncoder().encode(password),
+    { name: "PBKDF2" },
+    false,
+    ["deriveBits"]
+  );
+  const master = new Uint8Array(await crypto.subtle.deriveBits(
+    { name: "PBKDF2", salt: salt, iterations: 200000, hash: "SHA-1" },
+    keyMaterial,
+    256
+  ));
+
+  const label = (text) => new TextEncoder().encode(text);
+  const check = (await hmacSha256(master, label("blobify-check"))).slice(0, 16);
+  if (!bytesEqual(check, keyCheck)) {
+    console.error(" Password errata");
+    return null;
+  }
+  const macKey = await hmacSha256(master, label("blobify-mac"));
+  const mac = (await hmacSha256(macKey, header.slice(0, BLOB_HEADER_BODY_SIZE))).slice(0, 16);
+  if (!bytesEqual(mac, headerMac) || chunkSize === 0) {
+    console.error(" Header corrotto");
+    return null;
+  }
+  const expectedSize = BLOB_HEADER_SIZE + remaining + Math.max(1, Math.ceil(remaining / chunkSize)) * 16;
+  if (encryptedData.length !== expectedSize) {
+    console.error(" Blob troncato o corrotto");
+    return null;
+  }
+
+  const key = await crypto.subtle.importKey(
+    "raw", await hmacSha256(master, label("blobify-enc")), { name: "AES-GCM" }, false, ["decrypt"]
+  );
+
+  const output = new Uint8Array(remaining);
+  let offset = BLOB_HEADER_SIZE;
+  let written = 0;
+  for (let index = 0; ; index++) {
+    const length = Math.min(remaining, chunkSize);
+    const counter = new Uint8Array(4);
+    new DataView(counter.buffer).setUint32(0, index);
+    const nonce = new Uint8Array(12);
+    nonce.set(noncePrefix, 0);
+    nonce.set(counter, 8);
+    const aad = new Uint8Array(BLOB_HEADER_SIZE + 4);
+    aad.set(header, 0);
+    aad.set(counter, BLOB_HEADER_SIZE);
+
+    try {
+      const section = await crypto.subtle.decrypt(
+        { name: "AES-GCM", iv: nonce, additionalData: aad },
+        key,
+        encryptedData.slice(offset, offset + length + 16)
+      );
+      output.set(new Uint8Array(section), written);
+    } catch (err) {
+      console.error(` Sezione ${index} corrotta:`, err);
+      return null;
+    }
+
+    offset += length + 16;
+    written += length;
+    remaining -= length;
+    if (remaining === 0) return output;
+  }
+}
+
 async function decryptData(encryptedData, password) {
+  if (isBlobV2(encryptedData)) return decryptDataV2(encryptedData, password);
+
   const salt = encryptedData.slice(0, 16);
   const nonce = encryptedData.slice(16, 32);
   const tag = encryptedData.slice(32, 48);
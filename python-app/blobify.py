@@ -3,6 +3,17 @@ import os
 import shutil
 import subprocess
 import platform
+import select
+import struct
+import hmac
+import hashlib
+import zlib
+import threading
+import time
+import ctypes
+import ctypes.util
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLabel, QPushButton, QLineEdit, 
                              QRadioButton, QFileDialog, QProgressBar, 
@@ -14,7 +25,6 @@ from Crypto.Cipher import AES
 from Crypto.Protocol.KDF import PBKDF2
 from Crypto.Random import get_random_bytes
 import base64
-import struct
 
 # Metadata
 __version__ = "v.0.0.1" 
@@ -24,10 +34,41 @@ Blobify - {__version__} - a goodman, Frêney Studios
 __author__ = "a goodman, Frêney Studios"
 __all__ = [
     "WorkerThread",
+    "WatchThread",
+    "AuthenticationError",
     "resource_path",
     "ImageEncryptorApp"
 ]
 
+# Estensioni immagine accettate in cifratura
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp', '.bmp', '.gif', '.tiff')
+
+# Parametri modalità watch
+WATCH_DEBOUNCE_SECONDS = 2.0
+WATCH_POLL_INTERVAL = 1.0
+WATCH_MAX_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
+# Formato blob v2: header in chiaro + sezioni AES-GCM autenticate singolarmente
+BLOB_MAGIC = b"BLOB"
+BLOB_VERSION = 2
+BLOB_HEADER_BODY = struct.Struct(">4sBH16s8sIQ16s")
+BLOB_HEADER_SIZE = BLOB_HEADER_BODY.size + 16  # 75 byte -> 100 caratteri base64
+BLOB_HEADER_B64_SIZE = 4 * BLOB_HEADER_SIZE // 3
+BLOB_CHUNK_SIZE = 1024 * 1024
+GCM_TAG_SIZE = 16
+KDF_ITERATIONS = 200000
+
+# Cartella: si interrompe dopo N password errate consecutive
+MAX_AUTH_FAILURES = 3
+
+BlobHeader = namedtuple("BlobHeader", [
+    "magic", "version", "flags", "salt", "nonce_prefix",
+    "chunk_size", "plain_len", "key_check", "header_mac"
+])
+
+class AuthenticationError(Exception):
+    """Password errata: il key-check dell'header non corrisponde."""
+
 # Worker principale
 class WorkerThread(QThread):
     finished = pyqtSignal(bool, str)
@@ -35,7 +76,7 @@ class WorkerThread(QThread):
     
     def __init__(self, mode, target_type, path, password, output_base):
         super().__init__()
-        self.mode = xSQXmode
+        self.mode = mode
         self.target_type = target_type
         self.path = path
         self.password = password
@@ -55,7 +96,7 @@ class WorkerThread(QThread):
     
     def process_folder(self):
         if self.mode == "encrypt":
-            extensions = ('.png', '.jpg', '.jpeg', '.webp', '.bmp', '.gif', '.tiff')
+            extensions = IMAGE_EXTENSIONS
             output_folder = os.path.join(self.output_base, "encrypted_output")
         else:
             extensions = ('.png',)
@@ -66,6 +107,7 @@ class WorkerThread(QThread):
         os.makedirs(output_folder, exist_ok=True)
         
         files_processed = 0
+        auth_failures = 0
         for root, dirs, files in os.walk(self.path):
             if os.path.abspath(output_folder).startswith(os.path.abspath(self.path)):
                 if os.path.abspath(root) == os.path.abspath(output_folder) or output_folder in root:
@@ -79,13 +121,7 @@ class WorkerThread(QThread):
                         if output_folder in input_path:
                             continue
                         
-                        rel_path = os.path.relpath(root, self.path)
-                        
-                        if rel_path == '.':
-                            out_dir = output_folder
-                        else:
-                            out_dir = os.path.join(output_folder, rel_path)
-                        
+                        out_dir = self.mirrored_output_dir(root, output_folder)
                         os.makedirs(out_dir, exist_ok=True)
                         
                         self.progress.emit(f"Processing: {file}")
@@ -98,6 +134,13 @@ class WorkerThread(QThread):
                             self.decrypt_file(input_path, out_dir)
                         
                         files_processed += 1
+                        auth_failures = 0
+                    except AuthenticationError as e:
+                        self.progress.emit(f"Warning - Error on {file}: {str(e)}")
+                        auth_failures += 1
+                        if auth_failures >= MAX_AUTH_FAILURES:
+                            raise Exception(f"Aborted after {auth_failures} consecutive wrong password errors. Check the password.")
+                        continue
                     except Exception as e:
                         self.progress.emit(f"Warning - Error on {file}: {str(e)}")
                         continue
@@ -105,6 +148,13 @@ class WorkerThread(QThread):
         if files_processed == 0:
             raise Exception(f"No supported files found in {self.path}")
     
+    def mirrored_output_dir(self, input_dir, output_folder):
+        rel_path = os.path.relpath(input_dir, self.path)
+        
+        if rel_path == '.':
+            return output_folder
+        return os.path.join(output_folder, rel_path)
+    
     def process_file(self):
         if self.mode == "encrypt":
             output_dir = os.path.join(self.output_base, "encrypted_output")
@@ -142,12 +192,27 @@ class WorkerThread(QThread):
             except Exception as e:
                 raise Exception(f"Cannot open file as PNG: {str(e)}")
             
-            encrypted = self.extract_data_from_png(input_path)
+            # Header v2 letto dalle prime righe: password errata o blob
+            # troncato vengono scartati prima di decodificare tutta l'immagine
+            raw_header, (width, height) = self.read_blob_header(input_path)
+            header = None
+            if raw_header is not None:
+                header = self.parse_header(raw_header)
+                enc_key = self.unlock_header(header)
+                expected_size = self.blob_size(header)
+                if width * height < 4 * -(-expected_size // 3):
+                    raise Exception(f"Blob truncated (image too small for declared size)")
             
-            if len(encrypted) < 48:
-                raise Exception(f"PNG not encrypted with this program (data too small)")
+            encrypted = self.extract_data_from_png(input_path)
             
-            data = self.decrypt_data(encrypted)
+            if header is not None:
+                if len(encrypted) != expected_size:
+                    raise Exception(f"Blob truncated or corrupt (expected {expected_size} bytes, found {len(encrypted)})")
+                data = self.decrypt_sections(encrypted, header, enc_key)
+            else:
+                if len(encrypted) < 48:
+                    raise Exception(f"PNG not encrypted with this program (data too small)")
+                data = self.decrypt_data(encrypted)
             
             if len(data) < 2:
                 raise Exception(f"Invalid decrypted data")
@@ -176,24 +241,117 @@ class WorkerThread(QThread):
             
             with open(output_path, "wb") as f:
                 f.write(file_bytes)
+        except AuthenticationError as e:
+            raise AuthenticationError(f"Error decrypting {os.path.basename(input_path)}: {str(e)}")
         except Exception as e:
             raise Exception(f"Error decrypting {os.path.basename(input_path)}: {str(e)}")
     
+    def derive_keys(self, salt: bytes):
+        """Restituisce (chiave AES, chiave HMAC header, key-check) da password e salt."""
+        master = PBKDF2(self.password, salt, dkLen=32, count=KDF_ITERATIONS)
+        enc_key = hmac.new(master, b"blobify-enc", hashlib.sha256).digest()
+        mac_key = hmac.new(master, b"blobify-mac", hashlib.sha256).digest()
+        key_check = hmac.new(master, b"blobify-check", hashlib.sha256).digest()[:16]
+        return enc_key, mac_key, key_check
+    
+    @staticmethod
+    def section_nonce_and_aad(header: bytes, nonce_prefix: bytes, index: int):
+        counter = struct.pack(">I", index)
+        return nonce_prefix + counter, header + counter
+    
+    @staticmethod
+    def blob_size(header: BlobHeader) -> int:
+        sections = max(1, -(-header.plain_len // header.chunk_size))
+        return BLOB_HEADER_SIZE + header.plain_len + sections * GCM_TAG_SIZE
+    
     def encrypt_data(self, data: bytes) -> bytes:
         salt = get_random_bytes(16)
-        key = PBKDF2(self.password, salt, dkLen=32, count=200000)
-        cipher = AES.new(key, AES.MODE_GCM)
-        ciphertext, tag = cipher.encrypt_and_digest(data)
-        return salt + cipher.nonce + tag + ciphertext
+        nonce_prefix = get_random_bytes(8)
+        enc_key, mac_key, key_check = self.derive_keys(salt)
+        
+        body = BLOB_HEADER_BODY.pack(BLOB_MAGIC, BLOB_VERSION, 0, salt, nonce_prefix,
+                                     BLOB_CHUNK_SIZE, len(data), key_check)
+        header = body + hmac.new(mac_key, body, hashlib.sha256).digest()[:16]
+        
+        sections = [header]
+        for index, offset in enumerate(range(0, max(len(data), 1), BLOB_CHUNK_SIZE)):
+            nonce, aad = self.section_nonce_and_aad(header, nonce_prefix, index)
+            cipher = AES.new(enc_key, AES.MODE_GCM, nonce=nonce)
+            cipher.update(aad)
+            ciphertext, tag = cipher.encrypt_and_digest(data[offset:offset + BLOB_CHUNK_SIZE])
+            sections.append(ciphertext + tag)
+        return b"".join(sections)
+    
+    @staticmethod
+    def parse_header(header: bytes) -> BlobHeader:
+        if len(header) < BLOB_HEADER_SIZE or not header.startswith(BLOB_MAGIC):
+            raise Exception(f"Missing blob header")
+        fields = BlobHeader(*BLOB_HEADER_BODY.unpack_from(header), header[BLOB_HEADER_BODY.size:BLOB_HEADER_SIZE])
+        if fields.version != BLOB_VERSION:
+            raise Exception(f"Unsupported blob version {fields.version}")
+        return fields
+    
+    def unlock_header(self, header: BlobHeader) -> bytes:
+        """Verifica password e integrità dell'header; costa solo la KDF."""
+        enc_key, mac_key, key_check = self.derive_keys(header.salt)
+        
+        if not hmac.compare_digest(key_check, header.key_check):
+            raise AuthenticationError("Wrong password")
+        
+        body = BLOB_HEADER_BODY.pack(*header[:-1])
+        expected_mac = hmac.new(mac_key, body, hashlib.sha256).digest()[:16]
+        if not hmac.compare_digest(expected_mac, header.header_mac):
+            raise Exception(f"Corrupt blob header")
+        if header.chunk_size == 0:
+            raise Exception(f"Corrupt blob header (chunk size 0)")
+        return enc_key
+    
+    def decrypt_sections(self, encrypted_data: bytes, header: BlobHeader, enc_key: bytes) -> bytes:
+        raw_header = encrypted_data[:BLOB_HEADER_SIZE]
+        sections = []
+        offset = BLOB_HEADER_SIZE
+        remaining = header.plain_len
+        index = 0
+        while True:
+            length = min(remaining, header.chunk_size)
+            ciphertext = encrypted_data[offset:offset + length]
+            tag = encrypted_data[offset + length:offset + length + GCM_TAG_SIZE]
+            
+            nonce, aad = self.section_nonce_and_aad(raw_header, header.nonce_prefix, index)
+            cipher = AES.new(enc_key, AES.MODE_GCM, nonce=nonce)
+            cipher.update(aad)
+            try:
+                sections.append(cipher.decrypt_and_verify(ciphertext, tag))
+            except ValueError:
+                raise Exception(f"Corrupt data in section {index}")
+            
+            offset += length + GCM_TAG_SIZE
+            remaining -= length
+            index += 1
+            if remaining == 0:
+                break
+        return b"".join(sections)
     
     def decrypt_data(self, encrypted_data: bytes) -> bytes:
+        if encrypted_data.startswith(BLOB_MAGIC):
+            header = self.parse_header(encrypted_data)
+            enc_key = self.unlock_header(header)
+            if len(encrypted_data) != self.blob_size(header):
+                raise Exception(f"Blob truncated or corrupt")
+            return self.decrypt_sections(encrypted_data, header, enc_key)
+        
+        # Formato legacy (v1): salt + nonce + tag + ciphertext. Senza key-check
+        # password errata e dati corrotti non si distinguono: niente AuthenticationError
         salt = encrypted_data[:16]
         nonce = encrypted_data[16:32]
         tag = encrypted_data[32:48]
         ciphertext = encrypted_data[48:]
-        key = PBKDF2(self.password, salt, dkLen=32, count=200000)
+        key = PBKDF2(self.password, salt, dkLen=32, count=KDF_ITERATIONS)
         cipher = AES.new(key, AES.MODE_GCM, nonce=nonce)
-        return cipher.decrypt_and_verify(ciphertext, tag)
+        try:
+            return cipher.decrypt_and_verify(ciphertext, tag)
+        except ValueError:
+            raise Exception(f"Wrong password or corrupted data")
     
     @staticmethod
     def embed_to_png(encrypted_data: bytes, output_path: str):
@@ -230,6 +388,330 @@ class WorkerThread(QThread):
             return base64.b64decode(raw_bytes)
         except Exception as e:
             raise Exception(f"Invalid PNG or not encrypted with this program: {e}")
+    
+    @staticmethod
+    def read_png_head(path: str, nbytes: int):
+        """Decodifica solo le righe di pixel necessarie a leggere nbytes."""
+        with open(path, "rb") as f:
+            if f.read(8) != b"\x89PNG\r\n\x1a\n":
+                raise Exception(f"File is not a valid PNG")
+            length, chunk_type = struct.unpack(">I4s", f.read(8))
+            if chunk_type != b"IHDR":
+                raise Exception(f"File is not a valid PNG")
+            width, height, depth, color, _, _, interlace = struct.unpack(">IIBBBBB", f.read(length)[:13])
+            f.read(4)
+            
+            # Solo PNG grigi a 8 bit non interlacciati, come quelli generati da embed_to_png
+            if depth != 8 or color != 0 or interlace != 0 or width == 0:
+                img = Image.open(path).convert("L")
+                return img.tobytes()[:nbytes], img.size
+            
+            rows = min(height, -(-nbytes // width))
+            needed = rows * (width + 1)
+            inflater = zlib.decompressobj()
+            raw = b""
+            while len(raw) < needed:
+                chunk_header = f.read(8)
+                if len(chunk_header) < 8:
+                    break
+                length, chunk_type = struct.unpack(">I4s", chunk_header)
+                data = f.read(length)
+                f.read(4)
+                if chunk_type == b"IDAT":
+                    raw += inflater.decompress(data, needed - len(raw))
+                elif chunk_type == b"IEND":
+                    break
+        
+        pixels = bytearray()
+        prev = bytearray(width)
+        for row in range(len(raw) // (width + 1)):
+            line = raw[row * (width + 1):(row + 1) * (width + 1)]
+            filter_type = line[0]
+            cur = bytearray(line[1:])
+            for x in range(width):
+                a = cur[x - 1] if x else 0
+                b = prev[x]
+                c = prev[x - 1] if x else 0
+                if filter_type == 1:
+                    cur[x] = (cur[x] + a) & 0xFF
+                elif filter_type == 2:
+                    cur[x] = (cur[x] + b) & 0xFF
+                elif filter_type == 3:
+                    cur[x] = (cur[x] + ((a + b) >> 1)) & 0xFF
+                elif filter_type == 4:
+                    p = a + b - c
+                    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+                    predictor = a if pa <= pb and pa <= pc else (b if pb <= pc else c)
+                    cur[x] = (cur[x] + predictor) & 0xFF
+                elif filter_type != 0:
+                    raise Exception(f"Corrupt PNG (unknown filter {filter_type})")
+            pixels += cur
+            prev = cur
+        return bytes(pixels[:nbytes]), (width, height)
+    
+    @classmethod
+    def read_blob_header(cls, path: str):
+        """Restituisce l'header v2 grezzo (o None per i blob legacy) e le dimensioni del PNG."""
+        head, size = cls.read_png_head(path, BLOB_HEADER_B64_SIZE)
+        try:
+            raw_header = base64.b64decode(head, validate=True)
+        except Exception:
+            return None, size
+        if len(raw_header) < BLOB_HEADER_SIZE or not raw_header.startswith(BLOB_MAGIC):
+            return None, size
+        return raw_header[:BLOB_HEADER_SIZE], size
+
+class _PollingSource:
+    """Rileva file nuovi o modificati confrontando mtime e dimensione."""
+    
+    def __init__(self, root, is_excluded):
+        self.root = root
+        self.is_excluded = is_excluded
+        self.snapshot = self.scan()
+    
+    def scan(self):
+        snapshot = {}
+        for dirpath, dirnames, files in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames
+                           if not self.is_excluded(os.path.join(dirpath, d))]
+            for file in files:
+                path = os.path.join(dirpath, file)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                snapshot[path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+    
+    def changes(self, timeout):
+        time.sleep(timeout)
+        current = self.scan()
+        changed = [path for path, sig in current.items()
+                   if self.snapshot.get(path) != sig]
+        self.snapshot = current
+        return changed
+    
+    def close(self):
+        pass
+
+class _InotifySource:
+    """Rileva file nuovi o modificati tramite inotify (solo Linux)."""
+    
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_Q_OVERFLOW = 0x00004000
+    IN_ISDIR = 0x40000000
+    WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+    EVENT_HEADER = struct.Struct("iIII")
+    
+    def __init__(self, root, is_excluded):
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError("libc not found")
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        
+        self.root = root
+        self.is_excluded = is_excluded
+        self.watches = {}
+        self.drained_at = time.time()
+        try:
+            self.watch_tree(root)
+        except OSError:
+            # Es. ENOSPC con max_user_watches esaurito: chiudere l'fd rimuove anche i watch
+            os.close(self.fd)
+            raise
+    
+    def watch_tree(self, top):
+        """Aggiunge watch ricorsivi sotto top e restituisce i file già presenti."""
+        found = []
+        for dirpath, dirnames, files in os.walk(top):
+            dirnames[:] = [d for d in dirnames
+                           if not self.is_excluded(os.path.join(dirpath, d))]
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(dirpath), self.WATCH_MASK)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                raise OSError(errno, f"inotify_add_watch failed on {dirpath}: {os.strerror(errno)}")
+            self.watches[wd] = dirpath
+            found.extend(os.path.join(dirpath, file) for file in files)
+        return found
+    
+    def changes(self, timeout):
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            buffer = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        
+        changed = []
+        offset = 0
+        while offset + self.EVENT_HEADER.size <= len(buffer):
+            wd, mask, _, name_len = self.EVENT_HEADER.unpack_from(buffer, offset)
+            offset += self.EVENT_HEADER.size
+            name = buffer[offset:offset + name_len].rstrip(b"\0")
+            offset += name_len
+            
+            # Coda del kernel piena: eventi persi dopo l'ultimo svuotamento,
+            # si ricontrollano i file modificati da allora
+            if mask & self.IN_Q_OVERFLOW:
+                changed.extend(self.modified_since(self.drained_at - 1.0))
+                continue
+            
+            dirpath = self.watches.get(wd)
+            if dirpath is None or not name:
+                continue
+            path = os.path.join(dirpath, os.fsdecode(name))
+            
+            if mask & self.IN_ISDIR:
+                # Nuove sottocartelle: i file possono arrivare prima del watch
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO) and not self.is_excluded(path):
+                    try:
+                        changed.extend(self.watch_tree(path))
+                    except OSError:
+                        continue
+            else:
+                changed.append(path)
+        
+        checked_at = time.time()
+        if not select.select([self.fd], [], [], 0)[0]:
+            self.drained_at = checked_at
+        return changed
+    
+    def modified_since(self, since):
+        found = []
+        for dirpath, dirnames, files in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames
+                           if not self.is_excluded(os.path.join(dirpath, d))]
+            for file in files:
+                path = os.path.join(dirpath, file)
+                try:
+                    if os.stat(path).st_mtime >= since:
+                        found.append(path)
+                except OSError:
+                    continue
+        return found
+    
+    def close(self):
+        os.close(self.fd)
+
+# Worker della modalità watch: cifra le immagini appena compaiono nella cartella
+class WatchThread(WorkerThread):
+    
+    def __init__(self, path, password, output_base, max_workers=WATCH_MAX_WORKERS):
+        super().__init__("encrypt", "watch", path, password, output_base)
+        self.max_workers = max_workers
+        self.output_folder = os.path.join(self.output_base, "encrypted_output")
+        self.pending = {}
+        self.in_flight = set()
+        self.lock = threading.Lock()
+        self.stop_requested = False
+        self.files_processed = 0
+    
+    def stop(self):
+        self.stop_requested = True
+    
+    def run(self):
+        try:
+            os.makedirs(self.output_folder, exist_ok=True)
+            source = self.open_source()
+            try:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                    while not self.stop_requested:
+                        # Timestamp preso dopo l'attesa, così il debounce dura davvero WATCH_DEBOUNCE_SECONDS
+                        changed = source.changes(WATCH_POLL_INTERVAL)
+                        now = time.monotonic()
+                        for path in changed:
+                            if self.is_watched_image(path):
+                                self.pending[path] = (now, self.file_signature(path))
+                        self.dispatch_ready(pool)
+            finally:
+                source.close()
+            self.finished.emit(True, f"Watch stopped. {self.files_processed} file(s) encrypted.")
+        except Exception as e:
+            import traceback
+            error_msg = f"Error: {str(e)}\n\nDetails:\n{traceback.format_exc()}"
+            self.finished.emit(False, error_msg)
+    
+    def open_source(self):
+        try:
+            source = _InotifySource(self.path, self.is_excluded)
+            self.progress.emit(f"Watching {self.path} (inotify)")
+        except (OSError, AttributeError):
+            source = _PollingSource(self.path, self.is_excluded)
+            self.progress.emit(f"Watching {self.path} (polling)")
+        return source
+    
+    def is_excluded(self, path):
+        output_folder = os.path.abspath(self.output_folder)
+        path = os.path.abspath(path)
+        return path == output_folder or path.startswith(output_folder + os.sep)
+    
+    def is_watched_image(self, path):
+        return path.lower().endswith(IMAGE_EXTENSIONS) and not self.is_excluded(path)
+    
+    @staticmethod
+    def file_signature(path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def dispatch_ready(self, pool):
+        """Invia al pool i file fermi da almeno WATCH_DEBOUNCE_SECONDS."""
+        now = time.monotonic()
+        for path, (last_seen, last_sig) in list(self.pending.items()):
+            if now - last_seen < WATCH_DEBOUNCE_SECONDS:
+                continue
+            
+            sig = self.file_signature(path)
+            if sig is None:
+                del self.pending[path]
+                continue
+            
+            # File ancora in scrittura: riparte l'attesa
+            if sig != last_sig:
+                self.pending[path] = (now, sig)
+                continue
+            
+            with self.lock:
+                if path in self.in_flight or len(self.in_flight) >= self.max_workers:
+                    continue
+                self.in_flight.add(path)
+            del self.pending[path]
+            
+            future = pool.submit(self.encrypt_watched, path)
+            future.add_done_callback(lambda _, path=path: self.release(path))
+    
+    def release(self, path):
+        with self.lock:
+            self.in_flight.discard(path)
+    
+    def encrypt_watched(self, input_path):
+        file = os.path.basename(input_path)
+        try:
+            out_dir = self.mirrored_output_dir(os.path.dirname(input_path), self.output_folder)
+            os.makedirs(out_dir, exist_ok=True)
+            
+            self.progress.emit(f"Processing: {file}")
+            
+            output_name = os.path.splitext(file)[0] + "_encrypted.png"
+            self.encrypt_file(input_path, os.path.join(out_dir, output_name))
+            
+            with self.lock:
+                self.files_processed += 1
+            self.progress.emit(f"Encrypted: {file}")
+        except Exception as e:
+            self.progress.emit(f"Warning - Error on {file}: {str(e)}")
 
 def resource_path(relative_path : str):
     """ Restituisce il percorso assoluto alla risorsa, compatibile con PyInstaller """
@@ -311,12 +793,15 @@ class ImageEncryptorApp(QMainWindow):
         
         self.folder_radio = QRadioButton("Folder (recursive)")
         self.file_radio = QRadioButton("Single file")
+        self.watch_radio = QRadioButton("Watch folder")
         self.folder_radio.setChecked(True)
         self.folder_radio.toggled.connect(lambda: self.set_target("folder"))
         self.file_radio.toggled.connect(lambda: self.set_target("file"))
+        self.watch_radio.toggled.connect(lambda: self.set_target("watch"))
         
         target_layout.addWidget(self.folder_radio)
         target_layout.addWidget(self.file_radio)
+        target_layout.addWidget(self.watch_radio)
         target_layout.addStretch()
         target_group.setLayout(target_layout)
         main_layout.addWidget(target_group)
@@ -443,9 +928,9 @@ class ImageEncryptorApp(QMainWindow):
         self.status_label.setStyleSheet("color: #7f8c8d; font-size: 10px;")
         main_layout.addWidget(self.status_label)
         
-        execute_btn = QPushButton("EXECUTE")
-        execute_btn.clicked.connect(self.execute)
-        execute_btn.setStyleSheet("""
+        self.execute_btn = QPushButton("EXECUTE")
+        self.execute_btn.clicked.connect(self.execute)
+        self.execute_btn.setStyleSheet("""
             QPushButton {
                 background-color: #27ae60;
                 color: white;
@@ -462,7 +947,7 @@ class ImageEncryptorApp(QMainWindow):
                 background-color: #95a5a6;
             }
         """)
-        main_layout.addWidget(execute_btn)
+        main_layout.addWidget(self.execute_btn)
         
         main_layout.addStretch()
     
@@ -520,7 +1005,7 @@ class ImageEncryptorApp(QMainWindow):
         self.path_input.clear()
     
     def browse_path(self):
-        if self.target_type == "folder":
+        if self.target_type in ("folder", "watch"):
             path = QFileDialog.getExistingDirectory(self, "Select folder")
         else:
             if self.mode == "encrypt":
@@ -537,6 +1022,11 @@ class ImageEncryptorApp(QMainWindow):
             self.path_input.setText(path)
     
     def execute(self):
+        if isinstance(self.worker, WatchThread) and self.worker.isRunning():
+            self.worker.stop()
+            self.status_label.setText("Stopping watch...")
+            return
+        
         if not self.selected_path:
             QMessageBox.critical(self, "Error", "Select a file or folder!")
             return
@@ -545,6 +1035,10 @@ class ImageEncryptorApp(QMainWindow):
             QMessageBox.critical(self, "Error", "Enter a password!")
             return
         
+        if self.target_type == "watch":
+            self.start_watch()
+            return
+        
         if self.mode == "encrypt":
             output_folder = os.path.join(self.output_base, "encrypted_output")
         else:
@@ -575,11 +1069,37 @@ class ImageEncryptorApp(QMainWindow):
         self.worker.progress.connect(self.on_progress)
         self.worker.start()
     
+    def start_watch(self):
+        if self.mode != "encrypt":
+            QMessageBox.critical(self, "Error", "Watch folder only supports encryption!")
+            return
+        
+        self.progress_bar.setVisible(True)
+        self.status_label.setText("Watching...")
+        self.status_label.setStyleSheet("color: #e67e22; font-size: 10px;")
+        self.execute_btn.setText("STOP")
+        
+        self.worker = WatchThread(
+            self.selected_path, self.password_input.text(),
+            self.output_base
+        )
+        self.worker.finished.connect(self.on_finished)
+        self.worker.progress.connect(self.on_progress)
+        self.worker.start()
+    
+    def closeEvent(self, event):
+        # La modalità watch non termina da sola: va fermata prima di distruggere il QThread
+        if isinstance(self.worker, WatchThread) and self.worker.isRunning():
+            self.worker.stop()
+            self.worker.wait()
+        event.accept()
+    
     def on_progress(self, message : str):
         self.status_label.setText(message)
     
     def on_finished(self, success : bool, message : str):
         self.progress_bar.setVisible(False)
+        self.execute_btn.setText("EXECUTE")
         
         if bool(success):
             QMessageBox.information(self, "Success", message)
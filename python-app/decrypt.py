@@ -1,7 +1,14 @@
 from PIL import Image
 from Crypto.Cipher import AES
 from Crypto.Protocol.KDF import PBKDF2
-import base64, struct
+import base64, struct, hmac, hashlib
+
+BLOB_MAGIC = b"BLOB"
+BLOB_VERSION = 2
+KDF_ITERATIONS = 200000
+BLOB_HEADER_BODY = struct.Struct(">4sBH16s8sIQ16s")
+BLOB_HEADER_SIZE = BLOB_HEADER_BODY.size + 16
+GCM_TAG_SIZE = 16
 
 def extract_data_from_png(path: str) -> bytes:
     """Estrae i dati Base64 da un PNG grigio."""
@@ -10,13 +17,47 @@ def extract_data_from_png(path: str) -> bytes:
     raw_bytes = bytes(pixels)
     return base64.b64decode(raw_bytes)
 
+def decrypt_data_v2(encrypted_data: bytes, password: str) -> bytes:
+    """Decifra un blob v2: verifica il key-check prima delle sezioni AES-GCM."""
+    header = encrypted_data[:BLOB_HEADER_SIZE]
+    body = header[:BLOB_HEADER_BODY.size]
+    _, version, _, salt, nonce_prefix, chunk_size, plain_len, key_check = BLOB_HEADER_BODY.unpack(body)
+    if version != BLOB_VERSION:
+        raise ValueError(f"Versione blob non supportata: {version}")
+
+    master = PBKDF2(password, salt, dkLen=32, count=KDF_ITERATIONS)
+    enc_key = hmac.new(master, b"blobify-enc", hashlib.sha256).digest()
+    mac_key = hmac.new(master, b"blobify-mac", hashlib.sha256).digest()
+    if not hmac.compare_digest(hmac.new(master, b"blobify-check", hashlib.sha256).digest()[:16], key_check):
+        raise ValueError("Password errata")
+    if not hmac.compare_digest(hmac.new(mac_key, body, hashlib.sha256).digest()[:16], header[BLOB_HEADER_BODY.size:]):
+        raise ValueError("Header corrotto")
+
+    sections = []
+    offset = BLOB_HEADER_SIZE
+    index = 0
+    while True:
+        length = min(plain_len, chunk_size)
+        counter = struct.pack(">I", index)
+        cipher = AES.new(enc_key, AES.MODE_GCM, nonce=nonce_prefix + counter)
+        cipher.update(header + counter)
+        sections.append(cipher.decrypt_and_verify(encrypted_data[offset:offset + length],
+                                                  encrypted_data[offset + length:offset + length + GCM_TAG_SIZE]))
+        offset += length + GCM_TAG_SIZE
+        plain_len -= length
+        index += 1
+        if plain_len == 0:
+            return b"".join(sections)
+
 def decrypt_data(encrypted_data: bytes, password: str) -> bytes:
-    """Decifra i dati AES-GCM."""
+    """Decifra i dati AES-GCM (formato v2 o legacy)."""
+    if encrypted_data.startswith(BLOB_MAGIC):
+        return decrypt_data_v2(encrypted_data, password)
     salt = encrypted_data[:16]
     nonce = encrypted_data[16:32]
     tag = encrypted_data[32:48]
     ciphertext = encrypted_data[48:]
-    key = PBKDF2(password, salt, dkLen=32, count=200000)
+    key = PBKDF2(password, salt, dkLen=32, count=KDF_ITERATIONS)
     cipher = AES.new(key, AES.MODE_GCM, nonce=nonce)
     return cipher.decrypt_and_verify(ciphertext, tag)
 
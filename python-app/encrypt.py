@@ -2,15 +2,35 @@ from PIL import Image
 from Crypto.Cipher import AES
 from Crypto.Protocol.KDF import PBKDF2
 from Crypto.Random import get_random_bytes
-import base64, struct, os
+import base64, struct, os, hmac, hashlib
+
+BLOB_MAGIC = b"BLOB"
+BLOB_VERSION = 2
+BLOB_HEADER_BODY = struct.Struct(">4sBH16s8sIQ16s")
+BLOB_CHUNK_SIZE = 1024 * 1024
+KDF_ITERATIONS = 200000
 
 def encrypt_data(data: bytes, password: str) -> bytes:
-    """Cifra i dati con AES-GCM e password."""
+    """Cifra i dati nel formato blob v2: header con key-check + sezioni AES-GCM."""
     salt = get_random_bytes(16)
-    key = PBKDF2(password, salt, dkLen=32, count=200000)
-    cipher = AES.new(key, AES.MODE_GCM)
-    ciphertext, tag = cipher.encrypt_and_digest(data)
-    return salt + cipher.nonce + tag + ciphertext
+    nonce_prefix = get_random_bytes(8)
+    master = PBKDF2(password, salt, dkLen=32, count=KDF_ITERATIONS)
+    enc_key = hmac.new(master, b"blobify-enc", hashlib.sha256).digest()
+    mac_key = hmac.new(master, b"blobify-mac", hashlib.sha256).digest()
+    key_check = hmac.new(master, b"blobify-check", hashlib.sha256).digest()[:16]
+
+    body = BLOB_HEADER_BODY.pack(BLOB_MAGIC, BLOB_VERSION, 0, salt, nonce_prefix,
+                                 BLOB_CHUNK_SIZE, len(data), key_check)
+    header = body + hmac.new(mac_key, body, hashlib.sha256).digest()[:16]
+
+    sections = [header]
+    for index, offset in enumerate(range(0, max(len(data), 1), BLOB_CHUNK_SIZE)):
+        counter = struct.pack(">I", index)
+        cipher = AES.new(enc_key, AES.MODE_GCM, nonce=nonce_prefix + counter)
+        cipher.update(header + counter)
+        ciphertext, tag = cipher.encrypt_and_digest(data[offset:offset + BLOB_CHUNK_SIZE])
+        sections.append(ciphertext + tag)
+    return b"".join(sections)
 
 def embed_to_png(encrypted_data: bytes, output_path: str):
     """Embedda i dati cifrati in un'immagine PNG (grayscale)."""